@@ -4,7 +4,9 @@ so that parsers treat the entire log line as content without structural parsing.
 """
 
 import ast
+import os
 import re
+import shutil
 from pathlib import Path
 
 BASELINE_REPO = Path(__file__).parent / "logparser" / "logparser"
@@ -12,6 +14,21 @@ BASELINE_REPO = Path(__file__).parent / "logparser" / "logparser"
 # List of parser directories to modify
 PARSERS = ["Drain", "Spell", "IPLoM", "SLCT", "LenMa", "LogMine"]
 
+# Match either `"log_format": "any value here"` or `"regex": [...]` (including
+# multiline arrays and one level of nested brackets) in a single pass. The patterns
+# are ASCII, so they run on the raw bytes and the file is never decoded.
+SETTINGS_PATTERN = re.compile(
+    rb'(?P<format>"log_format"\s*:\s*)"[^"]*"'
+    rb'|"regex"\s*:\s*\[(?:[^\[\]]|\[[^\]]*\])*\]'
+)
+
+
+def _replace_setting(match):
+    if match.group("format") is not None:
+        return match.group("format") + b'"<Content>"'
+    return b'"regex": []'
+
+
 def modify_benchmark_file(benchmark_path):
     """
     Replace all log_format values in benchmark_settings with "<Content>"
@@ -22,32 +39,19 @@ def modify_benchmark_file(benchmark_path):
         return
 
     print(f"[modify] {benchmark_path}")
-    content = benchmark_path.read_text(encoding="utf-8")
-
-    # Use regex to replace log_format values
-    # Match: "log_format": "any value here",
-    pattern_format = r'("log_format"\s*:\s*)"[^"]*"'
-    replacement_format = r'\1"<Content>"'
-    modified = re.sub(pattern_format, replacement_format, content)
+    content = benchmark_path.read_bytes()
 
-    # Replace regex values with empty list
-    # Match: "regex": [...], (including multiline arrays)
-    pattern_regex = r'"regex"\s*:\s*\[(?:[^\[\]]|\[[^\]]*\])*\]'
-    replacement_regex = r'"regex": []'
-    modified = re.sub(pattern_regex, replacement_regex, modified, flags=re.DOTALL)
+    modified = SETTINGS_PATTERN.sub(_replace_setting, content)
 
-    # Backup original
+    # Stage the new content next to the original, keep a one-time copy of the
+    # original, then swap atomically so a crash never leaves the file missing.
+    tmp_path = benchmark_path.with_suffix('.py.tmp')
+    tmp_path.write_bytes(modified)
     backup_path = benchmark_path.with_suffix('.py.backup')
     if not backup_path.exists():
-        # Restore from backup first if it exists
-        if backup_path.exists():
-            content_backup = backup_path.read_text(encoding="utf-8")
-            benchmark_path.write_text(content_backup, encoding="utf-8")
-        benchmark_path.rename(backup_path)
+        shutil.copy2(benchmark_path, backup_path)
         print(f"  [backup] created {backup_path.name}")
-
-    # Write modified version
-    Path(benchmark_path).write_text(modified, encoding="utf-8")
+    os.replace(tmp_path, benchmark_path)
     print(f"  [done] log_format set to '<Content>', regex set to []")
 
 
@@ -1,12 +1,17 @@
 import argparse
+import copy
+import functools
+import importlib
 import json
+import multiprocessing
 import os
 import sys
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import ast
 
+import numpy as np
 import pandas as pd
 
 # Resolve paths using this file location (CWD independent)
@@ -16,6 +21,10 @@ BASELINE_PKG_ROOT = SCRIPT_DIR
 BASELINE_REPO = SCRIPT_DIR / "logparser"
 OUTPUT_ROOT = SCRIPT_DIR / "output"
 RESULTS_ROOT = SCRIPT_DIR / "results"
+SETTINGS_CACHE = BASELINE_REPO / ".settings_cache.json"
+# Default cap on parallel parser processes. Each one holds a whole dataset's df_log in
+# memory, and a worker killed for running out of memory breaks every pending job.
+DEFAULT_WORKERS = 2
 TOOLCHAIN_BIN = SCRIPT_DIR / ".." / "toolchains" / "winlibs" / "mingw64" / "bin"
 
 # Prepend toolchain bin to PATH so SLCT compilation can find gcc.
@@ -25,49 +34,136 @@ if TOOLCHAIN_BIN.exists():
 # Make upstream baselines importable (package path: logparser.logparser.*)
 sys.path.append(str(BASELINE_PKG_ROOT))
 
-from logparser.logparser.Drain import LogParser as DrainParser
-from logparser.logparser.Spell import LogParser as SpellParser
-from logparser.logparser.IPLoM import LogParser as IPLoMParser
-# from logparser.logparser.SLCT import LogParser as SLCTParser  # Disabled: cannot run
-from logparser.logparser.LenMa import LogParser as LenMaParser
-from logparser.logparser.LogMine import LogParser as LogMineParser
+# Module providing each baseline's LogParser class (package path: logparser.logparser.*).
+PARSER_MODULES = {
+    "Drain": "logparser.logparser.Drain",
+    "Spell": "logparser.logparser.Spell",
+    "IPLoM": "logparser.logparser.IPLoM",
+    # "SLCT": "logparser.logparser.SLCT",  # Disabled: cannot run
+    "LenMa": "logparser.logparser.LenMa",
+    "LogMine": "logparser.logparser.LogMine",
+}
 
+# Parser class (or the ImportError it raised) by method name. Filled once per worker
+# process by _worker_init(), so the main process never imports the parsers and jobs
+# only pass the method name.
+PARSERS_BY_NAME = {}
 
-def load_benchmark_settings(py_path):
-    """Parse benchmark_settings dict from the given file without executing top-level code."""
-    text = Path(py_path).read_text(encoding="utf-8")
-    tree = ast.parse(text)
+
+def _worker_init(methods):
+    """Import the requested parsers once per pool worker; jobs then reuse the warm imports.
+
+    A parser that fails to import is recorded instead of raised, so only that method's
+    jobs fail and the rest of the pool keeps working.
+    """
+    for method in methods:
+        try:
+            PARSERS_BY_NAME[method] = importlib.import_module(PARSER_MODULES[method]).LogParser
+        except ImportError as exc:
+            PARSERS_BY_NAME[method] = exc
+
+
+def _find_settings_node(tree, py_path):
     for node in tree.body:
         if isinstance(node, ast.Assign):
             for target in node.targets:
                 if isinstance(target, ast.Name) and target.id == "benchmark_settings":
-                    return ast.literal_eval(node.value)
+                    return node
     raise ValueError(f"benchmark_settings not found in {py_path}")
 
 
-def accuracy_metrics(truth, pred):
-    """Pairwise F1 (GA) and perfect-cluster accuracy (PA)."""
-    comb2 = lambda n: 0 if n < 2 else n * (n - 1) // 2
+def _parse_benchmark_settings(py_path):
+    """Compile and run only the benchmark_settings assignment in an isolated namespace.
+
+    The rest of benchmark.py (imports, the benchmark loop) never runs.
+    """
+    text = Path(py_path).read_text(encoding="utf-8")
+    node = _find_settings_node(ast.parse(text), py_path)
+    try:
+        ns = {"__builtins__": {}}
+        exec(compile(ast.Module(body=[node], type_ignores=[]), str(py_path), "exec"), ns)
+        return ns["benchmark_settings"]
+    except Exception:  # noqa: BLE001
+        return ast.literal_eval(node.value)
+
+
+def _read_settings_cache():
+    try:
+        return json.loads(SETTINGS_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_benchmark_settings(path_str, mtime_ns):
+    cache = _read_settings_cache()
+    entry = cache.get(path_str)
+    if entry and entry.get("mtime") == mtime_ns:
+        return entry["value"]
+    settings = _parse_benchmark_settings(path_str)
+    # Only persist settings that JSON stores faithfully; tuples or non-string keys would
+    # otherwise come back changed and later runs would pass different kwargs to parsers.
+    try:
+        round_trips = json.loads(json.dumps(settings)) == settings
+    except (TypeError, ValueError):
+        round_trips = False
+    if round_trips:
+        cache[path_str] = {"mtime": mtime_ns, "value": settings}
+        try:
+            SETTINGS_CACHE.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        except OSError as exc:
+            print(f"[warn] failed to write {SETTINGS_CACHE}: {exc}")
+    return settings
+
+
+def load_benchmark_settings(py_path):
+    """Parse benchmark_settings dict from the given file without executing top-level code.
+
+    Results are cached in-process and on disk (SETTINGS_CACHE), keyed by path and mtime.
+    """
+    py_path = Path(py_path).resolve()
+    # The memoized dict is shared between calls; hand each caller its own copy.
+    return copy.deepcopy(_load_benchmark_settings(str(py_path), py_path.stat().st_mtime_ns))
+
+
+def _codes(ids, codes=False):
+    """Dense integer cluster codes for ids.
 
-    truth_counts = Counter(truth)
-    real_pairs = sum(comb2(c) for c in truth_counts.values())
+    With codes=True, ids are already dense non-negative codes (from load_event_ids,
+    frame_event_ids or collapse_pure_clusters) and are used as-is. Otherwise ids are
+    arbitrary labels: they are factorized as objects, so "1" and 1 stay distinct and
+    missing ids form a cluster of their own.
+    """
+    if codes:
+        return np.asarray(ids)
+    return pd.factorize(pd.Series(ids, dtype=object), use_na_sentinel=False)[0]
 
-    pred_counts = Counter(pred)
-    parsed_pairs = sum(comb2(c) for c in pred_counts.values())
 
-    idx_by_pred = {}
-    for idx, pid in enumerate(pred):
-        idx_by_pred.setdefault(pid, []).append(idx)
+def _pair_count(counts):
+    """Sum of n*(n-1)/2 over an array of cluster sizes, as a Python int."""
+    counts = np.asarray(counts, dtype=np.int64)
+    return int((counts * (counts - 1) // 2).sum())
 
-    accurate_pairs = 0
-    accurate_events = 0
-    for pid, idxs in idx_by_pred.items():
-        gt_counts = Counter(truth[i] for i in idxs)
-        if len(gt_counts) == 1:
-            gt_id = next(iter(gt_counts))
-            if len(idxs) == truth_counts.get(gt_id, 0):
-                accurate_events += len(idxs)
-        accurate_pairs += sum(comb2(c) for c in gt_counts.values())
+
+def accuracy_metrics(truth, pred, codes=False):
+    """Pairwise F1 (GA) and perfect-cluster accuracy (PA). See _codes() for codes=."""
+    t_codes = _codes(truth, codes)
+    p_codes = _codes(pred, codes)
+
+    truth_counts = np.bincount(t_codes)
+    real_pairs = _pair_count(truth_counts)
+
+    parsed_pairs = _pair_count(np.bincount(p_codes))
+
+    # Non-empty cells of the pred x truth contingency table and their sizes.
+    n_truth = max(len(truth_counts), 1)
+    cells, cell_counts = np.unique(p_codes.astype(np.int64) * n_truth + t_codes, return_counts=True)
+    cell_pred, cell_gt = np.divmod(cells, n_truth)
+    accurate_pairs = _pair_count(cell_counts)
+
+    # A pred cluster is accurate when it maps to a single GT id and covers all of it.
+    single_gt = np.bincount(cell_pred)[cell_pred] == 1
+    accurate_events = int(cell_counts[single_gt & (cell_counts == truth_counts[cell_gt])].sum())
 
     precision = 0 if parsed_pairs == 0 else accurate_pairs / parsed_pairs
     recall = 0 if real_pairs == 0 else accurate_pairs / real_pairs
@@ -76,66 +172,90 @@ def accuracy_metrics(truth, pred):
     return {"GA": f1, "GA_precision": precision, "GA_recall": recall, "PA": accuracy}
 
 
-def purity_metric(base_ids, other_ids):
-    """Weighted dominant-ratio per base cluster."""
-    base_to_other = {}
-    for b, o in zip(base_ids, other_ids):
-        counts = base_to_other.setdefault(b, Counter())
-        counts[o] += 1
-    top_sum = 0
-    total_sum = 0
-    for counts in base_to_other.values():
-        total = sum(counts.values())
-        top = max(counts.values()) if counts else 0
-        total_sum += total
-        top_sum += top
-    return 0 if total_sum == 0 else top_sum / total_sum
-
-
-def collapse_pure_clusters(truth, pred):
-    """Merge over-split pure clusters into one cluster per GT id."""
-    gt_by_pred = {}
-    for p, t in zip(pred, truth):
-        s = gt_by_pred.setdefault(p, set())
-        s.add(t)
-
-    mapping = {}
-    pure_mask = []
-    for p in pred:
-        gts = gt_by_pred.get(p, set())
-        if len(gts) == 1:
-            only_gt = next(iter(gts))
-            mapping[p] = f"__PURE__#{only_gt}"
-            pure_mask.append(True)
-        else:
-            mapping[p] = p
-            pure_mask.append(False)
-
-    merged_pred = [mapping[p] for p in pred]
-    pure_coverage = 0 if len(pred) == 0 else sum(pure_mask) / len(pred)
-    return merged_pred, pure_coverage
+def purity_metric(base_ids, other_ids, codes=False):
+    """Weighted dominant-ratio per base cluster. See _codes() for codes=."""
+    df = pd.DataFrame({"b": _codes(base_ids, codes), "o": _codes(other_ids, codes)})
+    if df.empty:
+        return 0
+    sizes = df.groupby(["b", "o"], sort=False).size()
+    return int(sizes.groupby(level=0, sort=False).max().sum()) / len(df)
+
+
+def collapse_pure_clusters(truth, pred, codes=False):
+    """Merge over-split pure clusters into one cluster per GT id.
+
+    Returns (merged_pred, pure_coverage); merged_pred is non-negative integer codes bounded
+    by the number of pred plus GT clusters, so it can be scored with codes=True.
+    """
+    t_codes = _codes(truth, codes)
+    p_codes = _codes(pred, codes)
+    if len(p_codes) == 0:
+        return p_codes, 0
+    pure = pd.Series(t_codes).groupby(p_codes, sort=False).transform("nunique").to_numpy() == 1
+    # Pure clusters take a per-GT id offset past every pred code, so the two ranges never collide.
+    merged_pred = np.where(pure, int(p_codes.max()) + 1 + t_codes.astype(np.int64), p_codes)
+    return merged_pred, float(pure.mean())
+
+
+def _category_codes(ids):
+    """(codes, categories) for a categorical EventId series; missing ids map to ""."""
+    if ids.isna().any():
+        if "" not in ids.cat.categories:
+            ids = ids.cat.add_categories([""])
+        ids = ids.fillna("")
+    return ids.cat.codes.to_numpy(), ids.cat.categories
+
+
+def _read_category_column(csv_path, col):
+    """Read a single CSV column as a categorical Series, via PyArrow's threaded reader if installed."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pac
+    except ImportError:
+        return pd.read_csv(csv_path, usecols=[col], dtype={col: "category"}, engine="c")[col]
+    table = pac.read_csv(
+        csv_path,
+        convert_options=pac.ConvertOptions(
+            include_columns=[col], column_types={col: pa.string()}, strings_can_be_null=True
+        ),
+    )
+    return table.column(col).dictionary_encode().to_pandas()
 
 
 def load_event_ids(csv_path):
-    df = pd.read_csv(csv_path)
+    """Load the EventId column as (codes, categories); missing ids map to ""."""
+    header = pd.read_csv(csv_path, nrows=0).columns
     for col in ["EventId", "EventID", "eventId", "eventid"]:
-        if col in df.columns:
-            return df[col].fillna("").astype(str).tolist()
+        if col in header:
+            return _category_codes(_read_category_column(csv_path, col))
     raise ValueError(f"No EventId column found in {csv_path}")
 
 
+def frame_event_ids(df):
+    """Like load_event_ids, but for a parser's in-memory df_log; None if it has no EventId."""
+    if df is None or "EventId" not in df.columns:
+        return None
+    ids = df["EventId"]
+    # Match what a CSV round trip would produce: ids compared as strings.
+    ids = ids.where(ids.isna(), ids.astype(str)).astype("category")
+    return _category_codes(ids)
+
+
 def get_ground_truth(dataset_dir):
-    candidates = sorted(
-        [
-            p
-            for p in dataset_dir.glob("*.csv")
-            if p.name.endswith("_structured_corrected.csv") or p.name.endswith("_structured.csv")
-        ],
-        key=lambda p: ("corrected" not in p.name, p.name),
-    )
-    if not candidates:
+    # Prefer a corrected ground truth; min() keeps the pick deterministic without sorting.
+    gt_csv = min(dataset_dir.glob("*_structured_corrected.csv"), key=lambda p: p.name, default=None)
+    if gt_csv is None:
+        gt_csv = min(dataset_dir.glob("*_structured.csv"), key=lambda p: p.name, default=None)
+    if gt_csv is None:
         raise FileNotFoundError(f"No structured ground-truth CSV in {dataset_dir}")
-    return candidates[0]
+    return gt_csv
+
+
+def load_ground_truth(dataset_dir):
+    """Return (gt_csv, codes) for a dataset's ground truth."""
+    gt_csv = get_ground_truth(dataset_dir)
+    codes, _ = load_event_ids(gt_csv)
+    return gt_csv, codes
 
 
 def run_parser(method, setting, parser_cls, extra_kwargs, dataset, dataset_dir):
@@ -147,14 +267,87 @@ def run_parser(method, setting, parser_cls, extra_kwargs, dataset, dataset_dir):
         log_format=setting["log_format"],
         indir=str(log_path.parent),
         outdir=str(out_dir),
-        **extra_kwargs(setting),
+        **extra_kwargs,
     )
     parser.parse(log_path.name)
-    return out_dir / f"{log_path.name}_structured.csv"
+    # Most logparser classes keep the final frame (with EventId) on self.df_log.
+    return out_dir / f"{log_path.name}_structured.csv", getattr(parser, "df_log", None)
+
 
+def _run_one(method, dataset, setting, extra_kwargs, ground_truth):
+    """Run one parser on one dataset and score it. Executed in a worker process.
 
-def run_all(datasets, methods):
-    # Map method name to (benchmark_settings, parser_class, kwargs_mapper)
+    ground_truth is the load_ground_truth() result for the dataset, or the exception it raised.
+    """
+    dataset_dir = DATASETS_ROOT / dataset
+    try:
+        if isinstance(ground_truth, Exception):
+            raise ground_truth
+        gt_csv, truth = ground_truth
+        parser_cls = PARSERS_BY_NAME[method]
+        if isinstance(parser_cls, ImportError):
+            raise ImportError(f"cannot import {method} parser: {parser_cls}")
+        pred_csv, df_log = run_parser(method, setting, parser_cls, extra_kwargs, dataset, dataset_dir)
+        pred, _ = frame_event_ids(df_log) or load_event_ids(pred_csv)
+        if len(truth) != len(pred):
+            raise ValueError(f"Length mismatch truth={len(truth)} pred={len(pred)}")
+        metrics = accuracy_metrics(truth, pred, codes=True)
+        metrics["predPure"] = purity_metric(pred, truth, codes=True)
+        metrics["gtPure"] = purity_metric(truth, pred, codes=True)
+        friendly_pred, pure_cov = collapse_pure_clusters(truth, pred, codes=True)
+        friendly = accuracy_metrics(truth, friendly_pred, codes=True)
+        metrics["GA_friendly"] = friendly["GA"]
+        metrics["GA_friendly_precision"] = friendly["GA_precision"]
+        metrics["GA_friendly_recall"] = friendly["GA_recall"]
+        metrics["PA_friendly"] = friendly["PA"]
+        metrics["pureCoverage"] = pure_cov
+        return {
+            "method": method,
+            "dataset": dataset,
+            **metrics,
+            "pred_file": str(pred_csv),
+            "gt_file": str(gt_csv),
+        }
+    except Exception as exc:  # noqa: BLE001
+        return {"method": method, "dataset": dataset, "error": str(exc)}
+
+
+# Result table columns in output order. Results are accumulated column-wise; absent
+# fields are None for text columns and NaN for metric columns.
+RESULT_COLUMNS = (
+    "method",
+    "dataset",
+    "GA",
+    "GA_precision",
+    "GA_recall",
+    "PA",
+    "predPure",
+    "gtPure",
+    "GA_friendly",
+    "GA_friendly_precision",
+    "GA_friendly_recall",
+    "PA_friendly",
+    "pureCoverage",
+    "coverage",
+    "pred_file",
+    "gt_file",
+    "error",
+)
+TEXT_COLUMNS = {"method", "dataset", "pred_file", "gt_file", "error"}
+
+
+def new_result_columns():
+    return {col: [] for col in RESULT_COLUMNS}
+
+
+def append_result(cols, record):
+    """Append one result record (a dict keyed by column name) to the column lists."""
+    for col, values in cols.items():
+        values.append(record.get(col, None if col in TEXT_COLUMNS else np.nan))
+
+
+def run_all(datasets, methods, workers=None):
+    # Map method name to (benchmark_settings, kwargs_mapper)
     base = BASELINE_REPO / "logparser"
     drain_settings = load_benchmark_settings(base / "Drain" / "benchmark.py")
     spell_settings = load_benchmark_settings(base / "Spell" / "benchmark.py")
@@ -165,32 +358,26 @@ def run_all(datasets, methods):
     runners = {
         "Drain": (
             drain_settings,
-            DrainParser,
             lambda s: {"rex": s.get("regex", []), "depth": s.get("depth", 4), "st": s.get("st", 0.5)},
         ),
         "Spell": (
             spell_settings,
-            SpellParser,
             lambda s: {"rex": s.get("regex", []), "tau": s.get("tau", 0.5)},
         ),
         "IPLoM": (
             iplom_settings,
-            IPLoMParser,
             lambda s: {"rex": s.get("regex", []), "CT": s.get("CT", 0.35), "lowerBound": s.get("lowerBound", 0.25)},
         ),
         # "SLCT": (  # Disabled: cannot run
         #     slct_settings,
-        #     SLCTParser,
         #     lambda s: {"rex": s.get("regex", []), "support": s.get("support", 10)},
         # ),
         "LenMa": (
             lenma_settings,
-            LenMaParser,
             lambda s: {"rex": s.get("regex", []), "threshold": s.get("threshold", 0.7)},
         ),
         "LogMine": (
             logmine_settings,
-            LogMineParser,
             lambda s: {
                 "rex": s.get("regex", []),
                 "max_dist": s.get("max_dist", 0.002),
@@ -200,12 +387,12 @@ def run_all(datasets, methods):
         ),
     }
 
-    results = []
+    jobs = []
     for method in methods:
         if method not in runners:
             print(f"[skip] Unknown method {method}")
             continue
-        bench_settings, parser_cls, kw_mapper = runners[method]
+        bench_settings, kw_mapper = runners[method]
         for dataset in datasets:
             setting = bench_settings.get(dataset)
             dataset_dir = DATASETS_ROOT / dataset
@@ -215,65 +402,90 @@ def run_all(datasets, methods):
             if not dataset_dir.exists():
                 print(f"[skip] dataset folder missing: {dataset_dir}")
                 continue
+            jobs.append((method, dataset, setting, kw_mapper(setting)))
+    results = new_result_columns()
+    if not jobs:
+        return results
+
+    jobs_by_dataset = {}
+    for i, job in enumerate(jobs):
+        jobs_by_dataset.setdefault(job[1], []).append(i)
+
+    # Parsers are independent and CPU-bound: run every (method, dataset) pair in its own
+    # worker and keep results in submission order.
+    ordered = [None] * len(jobs)
+    max_workers = workers or min(len(jobs), os.cpu_count() or 1, DEFAULT_WORKERS)
+    job_methods = list(dict.fromkeys(job[0] for job in jobs))
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_worker_init, initargs=(job_methods,)
+    ) as pool:
+        futures = {}
+        # Every method on a dataset shares its ground truth: load it once, then submit that
+        # dataset's jobs right away so they run while the next ground truth loads.
+        for dataset, indices in jobs_by_dataset.items():
             try:
-                pred_csv = run_parser(method, setting, parser_cls, kw_mapper, dataset, dataset_dir)
-                gt_csv = get_ground_truth(dataset_dir)
-                truth = load_event_ids(gt_csv)
-                pred = load_event_ids(pred_csv)
-                if len(truth) != len(pred):
-                    raise ValueError(f"Length mismatch truth={len(truth)} pred={len(pred)}")
-                metrics = accuracy_metrics(truth, pred)
-                metrics["predPure"] = purity_metric(pred, truth)
-                metrics["gtPure"] = purity_metric(truth, pred)
-                friendly_pred, pure_cov = collapse_pure_clusters(truth, pred)
-                friendly = accuracy_metrics(truth, friendly_pred)
-                metrics["GA_friendly"] = friendly["GA"]
-                metrics["GA_friendly_precision"] = friendly["GA_precision"]
-                metrics["GA_friendly_recall"] = friendly["GA_recall"]
-                metrics["PA_friendly"] = friendly["PA"]
-                metrics["pureCoverage"] = pure_cov
-                results.append(
-                    {
-                        "method": method,
-                        "dataset": dataset,
-                        **metrics,
-                        "pred_file": str(pred_csv),
-                        "gt_file": str(gt_csv),
-                    }
-                )
+                ground_truth = load_ground_truth(DATASETS_ROOT / dataset)
+            except Exception as exc:  # noqa: BLE001
+                ground_truth = exc
+            for i in indices:
+                futures[pool.submit(_run_one, *jobs[i], ground_truth)] = i
+        for future in as_completed(futures):
+            i = futures[future]
+            method, dataset = jobs[i][:2]
+            try:
+                result = future.result()
+            except Exception as exc:  # noqa: BLE001
+                result = {"method": method, "dataset": dataset, "error": str(exc)}
+            if "error" in result:
+                print(f"[fail] {method}/{dataset}: {result['error']}")
+            else:
                 print(
-                    f"[ok] {method}/{dataset}: GA={metrics['GA']:.3f} "
-                    f"(P={metrics['GA_precision']:.3f}, R={metrics['GA_recall']:.3f}) "
-                    f"PA={metrics['PA']:.3f}"
+                    f"[ok] {method}/{dataset}: GA={result['GA']:.3f} "
+                    f"(P={result['GA_precision']:.3f}, R={result['GA_recall']:.3f}) "
+                    f"PA={result['PA']:.3f}"
                 )
-            except Exception as exc:  # noqa: BLE001
-                print(f"[fail] {method}/{dataset}: {exc}")
-                results.append({"method": method, "dataset": dataset, "error": str(exc)})
+            ordered[i] = result
+    for result in ordered:
+        append_result(results, result)
     return results
 
 
 def save_results(results):
+    """Write the column-wise results as CSV, JSON and (if possible) Parquet."""
     ts = datetime.utcnow().isoformat().replace(":", "-").replace(".", "-")
     run_dir = RESULTS_ROOT / ts
     run_dir.mkdir(parents=True, exist_ok=True)
     json_path = run_dir / "baseline-metrics.json"
     csv_path = run_dir / "baseline-metrics.csv"
-    pd.DataFrame(results).to_csv(csv_path, index=False)
+    parquet_path = run_dir / "baseline-metrics.parquet"
+    # Columns no row filled in (e.g. "error" on a clean run) are left out, as before.
+    df = pd.DataFrame(results).dropna(axis=1, how="all")
+    df.to_csv(csv_path, index=False)
+    records = [
+        {col: results[col][i] for col in RESULT_COLUMNS if not pd.isna(results[col][i])}
+        for i in range(len(results["method"]))
+    ]
     with open(json_path, "w", encoding="utf-8") as f:
-        json.dump({"generated_at": ts, "results": results}, f, ensure_ascii=False, indent=2)
+        json.dump({"generated_at": ts, "results": records}, f, ensure_ascii=False, indent=2)
     print(f"[write] {json_path}")
     print(f"[write] {csv_path}")
+    try:
+        df.to_parquet(parquet_path, index=False)
+        print(f"[write] {parquet_path}")
+    except (ImportError, TypeError, ValueError) as exc:
+        # Parquet is an optional extra: a missing engine or a column Arrow cannot type
+        # (e.g. a non-numeric metric from the "Ours" JSON) must not stop plotting.
+        print(f"[warn] skip {parquet_path.name}: {exc}")
     return csv_path, run_dir
 
 
 def load_ours_results():
     """Load latest evaluation results from results/*.json and map to baseline schema."""
     eval_dir = Path("../results").resolve()
-    json_files = sorted(eval_dir.glob("*.json"))
-    if not json_files:
+    latest = max(eval_dir.glob("*.json"), key=lambda p: p.stat().st_mtime_ns, default=None)
+    if latest is None:
         print("[warn] no evaluation results found for 'Ours'")
         return []
-    latest = json_files[-1]
     try:
         data = json.loads(latest.read_text(encoding="utf-8"))
     except Exception as exc:  # noqa: BLE001
@@ -309,6 +521,7 @@ def load_ours_results():
 
 
 def plot_results(csv_path, methods, datasets):
+    """Render one bar chart per metric next to csv_path. Run from main() in a child process."""
     try:
         import matplotlib.pyplot as plt
     except Exception as exc:  # noqa: BLE001
@@ -317,7 +530,8 @@ def plot_results(csv_path, methods, datasets):
 
     plt.rcParams.update({"font.family": "DejaVu Sans", "axes.unicode_minus": False})
 
-    df = pd.read_csv(csv_path)
+    parquet_path = csv_path.with_suffix(".parquet")
+    df = pd.read_parquet(parquet_path) if parquet_path.exists() else pd.read_csv(csv_path)
     df = df[df["error"].isna()] if "error" in df.columns else df
     if df.empty:
         print("[warn] no successful results to plot")
@@ -336,11 +550,12 @@ def plot_results(csv_path, methods, datasets):
     for metric in metrics_to_plot:
         if metric not in df.columns:
             continue
-        pivot = (
-            df.pivot(index="dataset", columns="method", values=metric)
-            .reindex(index=datasets, columns=methods)
+        pivot = df.pivot_table(
+            index="dataset", columns="method", values=metric, aggfunc="first", fill_value=0
+        )
+        pivot = pivot.reindex(
+            index=[d for d in datasets if d in pivot.index], columns=methods, fill_value=0
         )
-        pivot = pivot.dropna(how="all").fillna(0)
         ax = pivot.plot(
             kind="bar",
             figsize=(12, 7),
@@ -382,19 +597,35 @@ def main():
         default=True,
         help="Include latest evaluation results from evaluation/results as method 'Ours'",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            f"Parallel parser processes (default: {DEFAULT_WORKERS}). Each holds a full dataset "
+            "in memory; raise it only if RAM allows"
+        ),
+    )
     args = parser.parse_args()
 
     # Determine datasets to process: intersection of requested and existing
     available = sorted({p.name for p in DATASETS_ROOT.iterdir() if p.is_dir()})
     datasets = args.datasets if args.datasets else available
-    results = run_all(datasets, args.methods)
+    results = run_all(datasets, args.methods, args.workers)
     if args.include_ours:
         ours = load_ours_results()
-        results.extend([r for r in ours if r.get("dataset") in datasets])
+        for r in ours:
+            if r.get("dataset") in datasets:
+                append_result(results, r)
         if "Ours" not in args.methods:
             args.methods.append("Ours")
     csv_path, run_dir = save_results(results)
-    plot_results(Path(csv_path), args.methods, datasets)
+    # Results are already on disk; render plots in a separate process so this one never
+    # pays the matplotlib import and font-cache setup.
+    plotter = multiprocessing.Process(
+        target=plot_results, args=(Path(csv_path), args.methods, datasets), name="plot-results"
+    )
+    plotter.start()
 
 
 if __name__ == "__main__":